@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.limiter import limiter
 from app.core.logging import get_logger
-from app.core.security import create_access_token, verify_password
+from app.core.security import create_access_token, verify_password_or_dummy_async
 from app.db.models import User
 from app.db.session import get_db
 from app.schemas.user import Token, UserLogin
@@ -88,13 +88,23 @@ async def login(
     - Token expires after configured duration (default: 24 hours)
     - Token contains user ID, email, and role information
     """
-    result = await db.execute(select(User).where(User.email == user_login.email))
-    user = result.scalar_one_or_none()
+    # Select only the columns needed to authenticate; no ORM entity is hydrated
+    result = await db.execute(
+        select(User.id, User.email, User.password_hash, User.is_active, User.role).where(
+            User.email == user_login.email
+        )
+    )
+    user = result.first()
 
     # Get client IP for audit logging
     client_ip = request.client.host if request.client else "unknown"
 
-    if not user or not verify_password(user_login.password, user.password_hash):
+    # Always run the password hash check so unknown emails take as long as wrong passwords
+    password_ok = await verify_password_or_dummy_async(
+        user_login.password, user.password_hash if user else None
+    )
+
+    if not user or not password_ok:
         # Log failed login attempt for security audit
         logger.warning(
             "Failed login attempt",
@@ -6,7 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_active_user, get_current_admin_user
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.db.models import User
 from app.db.session import get_db
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
@@ -55,7 +55,7 @@ async def create_user(
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
-        password_hash=get_password_hash(user_in.password),
+        password_hash=await get_password_hash_async(user_in.password),
         role=user_in.role,
         is_active=user_in.is_active,
     )
@@ -109,7 +109,7 @@ async def update_user(
     # Update fields
     update_data = user_in.model_dump(exclude_unset=True)
     if "password" in update_data:
-        update_data["password_hash"] = get_password_hash(update_data.pop("password"))
+        update_data["password_hash"] = await get_password_hash_async(update_data.pop("password"))
 
     for field, value in update_data.items():
         setattr(user, field, value)
@@ -1,6 +1,9 @@
 """WebSocket API endpoint."""
+import itertools
+import string
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from jose import JWTError
 
@@ -11,13 +14,79 @@ from app.ws.manager import manager
 router = APIRouter(tags=["websocket"])
 logger = get_logger(__name__)
 
+# Per-process connection sequence; unlike id(websocket) it is never reused
+_connection_seq = itertools.count(1)
+
+# Upper bound for a token worth decoding; ours are a few hundred bytes
+_MAX_TOKEN_LENGTH = 8192
+
+# Subprotocol prefix carrying the JWT, compared case-insensitively
+_BEARER_PREFIX = "bearer."
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+# Translation table that deletes every base64url character plus the JWT separator
+_JWT_CHARS_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "-_.")
+
+
+def _looks_like_jwt(token: str) -> bool:
+    """
+    Cheap structural check run before full JWT verification.
+
+    A compact JWS is three base64url segments separated by dots, and the
+    header segment of our tokens always starts with '{"' ("eyJ" encoded).
+    Rejecting anything else avoids base64/JSON/signature work for junk input.
+
+    Args:
+        token: Candidate token
+
+    Returns:
+        True if the token is worth passing to decode_access_token
+    """
+    return (
+        len(token) < _MAX_TOKEN_LENGTH
+        and token.startswith("eyJ")
+        and token.count(".") == 2
+        and token.isascii()
+        and not token.translate(_JWT_CHARS_DELETE)
+    )
+
+
+def _token_from_subprotocols(protocols: str) -> Optional[str]:
+    """
+    Extract a JWT from a Sec-WebSocket-Protocol header value.
+
+    Scans the comma-separated entries in place and returns the first one
+    carrying the "Bearer.<token>" prefix (case-insensitive).
+
+    Args:
+        protocols: Raw Sec-WebSocket-Protocol header value
+
+    Returns:
+        Token without the prefix, or None if no entry carries one
+    """
+    length = len(protocols)
+    start = 0
+    while start < length:
+        end = protocols.find(",", start)
+        if end == -1:
+            end = length
+        while start < end and protocols[start] in " \t":
+            start += 1
+        prefix_end = start + _BEARER_PREFIX_LEN
+        if end > prefix_end and protocols[start:prefix_end].lower() == _BEARER_PREFIX:
+            token = protocols[prefix_end:end].strip()
+            if token:
+                return token
+        start = end + 1
+    return None
+
 
 async def get_websocket_user(websocket: WebSocket) -> Optional[dict]:
     """
     Authenticate WebSocket connection via token.
 
     Accepts token from (in order of preference):
-    1. Sec-WebSocket-Protocol header: "Bearer, <JWT_TOKEN>"
+    1. Sec-WebSocket-Protocol header: "Bearer.<JWT_TOKEN>"
     2. Query parameters (deprecated): ws://host/ws?token=JWT_TOKEN
 
     The Sec-WebSocket-Protocol approach is more secure as tokens
@@ -34,17 +103,7 @@ async def get_websocket_user(websocket: WebSocket) -> Optional[dict]:
     # Try to get token from Sec-WebSocket-Protocol header (preferred)
     protocols = websocket.headers.get("sec-websocket-protocol", "")
     if protocols:
-        # Format: "Bearer, <token>" or just "<token>"
-        parts = [p.strip() for p in protocols.split(",")]
-        for part in parts:
-            if part.lower().startswith("bearer."):
-                # Format: "Bearer.<token>"
-                token = part[7:]  # Remove "Bearer." prefix
-                break
-            elif len(part) > 20 and "." in part:  # JWT tokens have dots
-                # Assume it's a bare token
-                token = part
-                break
+        token = _token_from_subprotocols(protocols)
 
     # Fallback to query parameter (deprecated but backward compatible)
     if not token:
@@ -55,11 +114,11 @@ async def get_websocket_user(websocket: WebSocket) -> Optional[dict]:
                 "Use Sec-WebSocket-Protocol header instead for better security."
             )
 
-    if not token:
+    if not token or not _looks_like_jwt(token):
         return None
 
     payload = decode_access_token(token)
-    if payload is None:
+    if payload is None or payload.get("user_id") is None:
         return None
 
     return payload
@@ -124,10 +183,10 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         return
 
     # Generate client ID from user info
-    client_id = f"user_{user_data.get('user_id')}_{id(websocket)}"
+    client_id = f"user_{user_data['user_id']}_{next(_connection_seq)}"
 
-    # Connect client
-    client_id = await manager.connect(websocket, client_id)
+    # Connect client (manager keeps the ID we pass in)
+    await manager.connect(websocket, client_id)
 
     try:
         while True:
@@ -137,9 +196,9 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             # Handle message
             response = await manager.handle_client_message(client_id, message_text)
 
-            # Send response if any
+            # Send response if any (orjson is much faster than the stdlib encoder)
             if response:
-                await websocket.send_json(response)
+                await websocket.send_text(orjson.dumps(response).decode())
 
     except WebSocketDisconnect:
         await manager.disconnect(client_id)
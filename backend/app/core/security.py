@@ -1,8 +1,22 @@
 """Security utilities for authentication and authorization."""
+import asyncio
+import base64
+import calendar
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from secrets import token_urlsafe
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 from passlib.context import CryptContext
 
 # Import compatibility shims before configuring passlib so that bcrypt works on
@@ -17,6 +31,37 @@ logger = get_logger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is deliberately slow, so hashing runs on a shared bounded pool instead
+# of blocking the event loop for every other request and WebSocket client.
+_PASSWORD_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="pwd"
+)
+
+# Decoded token claims are cached briefly so reconnecting WebSocket clients and
+# repeated API calls don't pay for signature verification on every request.
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 30.0
+
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = Lock()
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as used in JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    try:
+        return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except ValueError as e:
+        raise JWTError("Invalid segment encoding.") from e
+
+
+# The HS256 header never changes, so it is encoded once at import time.
+_HS256_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -28,26 +73,206 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash of a random password, verified against when there is no real hash."""
+    return get_password_hash(token_urlsafe(16))
+
+
+def prepare_dummy_password_hash() -> None:
+    """Compute the dummy hash ahead of time so no login request pays for it."""
+    _dummy_password_hash()
+
+
+def verify_password_or_dummy(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password, doing the same hashing work when there is no hash.
+
+    Logins for unknown emails verify against a dummy hash so they take as long
+    as logins with a wrong password, and do not reveal which emails exist.
+
+    Args:
+        plain_password: Password submitted by the client
+        hashed_password: Stored hash, or None if the user does not exist
+
+    Returns:
+        True only if a hash was given and the password matches it
+    """
+    if hashed_password is None:
+        pwd_context.verify(plain_password, _dummy_password_hash())
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
+async def verify_password_or_dummy_async(
+    plain_password: str, hashed_password: Optional[str]
+) -> bool:
+    """Run ``verify_password_or_dummy`` on the password thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _PASSWORD_POOL, verify_password_or_dummy, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Run ``get_password_hash`` on the password thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_POOL, get_password_hash, password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT access token."""
+    """
+    Create a JWT access token.
+
+    HS256 tokens are signed directly with ``hmac``/``hashlib`` using the
+    precomputed header; other algorithms go through ``jose``.
+    """
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+
+    if settings.algorithm == "HS256":
+        to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+        signing_input = _HS256_HEADER_B64 + b"." + _b64url(orjson.dumps(to_encode))
+        secret_key = settings.secret_key.encode()
+        signature = hmac.new(secret_key, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + _b64url(signature)).decode()
+
     to_encode.update({"exp": expire})
     encoded_jwt: str = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Digest the token so the cache never retains raw bearer credentials."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token claims (e.g. after rotating the secret key)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def _int_claim(payload: Dict[str, Any], name: str, error: str) -> Optional[int]:
+    """Read a NumericDate claim as an integer, as ``jose`` does."""
+    if name not in payload:
+        return None
+    try:
+        return int(payload[name])
+    except (TypeError, ValueError, OverflowError) as e:
+        raise JWTClaimsError(error) from e
+
+
+def _validate_claims(payload: Dict[str, Any]) -> None:
+    """
+    Apply the registered-claim checks ``jwt.decode`` runs with default options.
+
+    Raises:
+        JWTClaimsError: If a registered claim is malformed, the token is not
+            valid yet, or it carries a claim that cannot be verified here
+        ExpiredSignatureError: If the token has expired
+    """
+    now = int(time.time())
+    _int_claim(payload, "iat", "Issued At claim (iat) must be an integer.")
+    nbf = _int_claim(payload, "nbf", "Not Before claim (nbf) must be an integer.")
+    if nbf is not None and nbf > now:
+        raise JWTClaimsError("The token is not yet valid (nbf)")
+    exp = _int_claim(payload, "exp", "Expiration Time claim (exp) must be an integer.")
+    if exp is not None and exp < now:
+        raise ExpiredSignatureError("Signature has expired.")
+
+    # No audience is expected, so any audience claim is rejected
+    if "aud" in payload:
+        raise JWTClaimsError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise JWTClaimsError("Subject must be a string.")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise JWTClaimsError("JWT ID must be a string.")
+    if "at_hash" in payload:
+        raise JWTClaimsError("No access_token provided to compare against at_hash claim.")
+
+
+def _decode_hs256(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 token with ``hmac``/``hashlib`` and return its claims.
+
+    Checks the same things as ``jwt.decode`` with default options: the
+    algorithm, the signature, and the registered ``iat``, ``nbf``, ``exp``,
+    ``aud``, ``sub``, ``jti`` and ``at_hash`` claims.
+
+    Raises:
+        JWTError: If the token is malformed, the signature does not match or
+            a registered claim is invalid (including expiry)
+    """
+    try:
+        signing_input, signature_b64 = token.encode("ascii").rsplit(b".", 1)
+        header_b64, payload_b64 = signing_input.split(b".")
+    except (UnicodeEncodeError, ValueError) as e:
+        raise JWTError("Not enough segments.") from e
+
+    try:
+        header = orjson.loads(_b64url_decode(header_b64))
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except orjson.JSONDecodeError as e:
+        raise JWTError("Invalid segment content.") from e
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise JWTError("The specified alg value is not allowed.")
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload string: must be a json object.")
+
+    secret_key = settings.secret_key.encode()
+    expected = hmac.new(secret_key, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+        raise JWTError("Signature verification failed.")
+
+    _validate_claims(payload)
+    return payload
+
+
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
-    """Decode and verify a JWT access token."""
+    """
+    Decode and verify a JWT access token.
+
+    Successfully decoded claims are cached for up to ``TOKEN_CACHE_TTL_SECONDS``
+    (never past the token's own ``exp``). Decode failures are never cached.
+    HS256 tokens are verified directly with ``hmac``; other algorithms go
+    through ``jose``.
+    """
+    key = _token_cache_key(token)
+    now = time.time()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            expires_at, cached_payload = cached
+            if expires_at > now:
+                _token_cache.move_to_end(key)
+                return dict(cached_payload)
+            del _token_cache[key]
+
     try:
-        payload: Dict[str, Any] = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        return payload
+        payload: Dict[str, Any]
+        if settings.algorithm == "HS256":
+            payload = _decode_hs256(token)
+        else:
+            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
     except JWTError as e:
         # Log error but NEVER log token or secret_key - security risk!
         logger.debug(f"JWT decode error: {e}")
         return None
+
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, float(exp))
+
+    with _token_cache_lock:
+        _token_cache[key] = (expires_at, payload)
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
+    return dict(payload)
@@ -1,7 +1,52 @@
 """Validation utilities for input data."""
-import re
 from typing import Optional
 
+# Minimum password length, checked before any character is inspected
+_MIN_LEN = 8
+_ERR_LEN = f"Password must be at least {_MIN_LEN} characters"
+
+# Characters accepted as "special" by the password policy
+_SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Character class bits required by the password policy
+_UPPER = 1
+_LOWER = 2
+_DIGIT = 4
+_SPECIAL = 8
+_ALL_CATEGORIES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+
+
+def _build_category_table() -> bytes:
+    """Build a 128-entry table holding the category bit of each ASCII code point."""
+    table = bytearray(128)
+    for code in range(ord("A"), ord("Z") + 1):
+        table[code] = _UPPER
+    for code in range(ord("a"), ord("z") + 1):
+        table[code] = _LOWER
+    for code in range(ord("0"), ord("9") + 1):
+        table[code] = _DIGIT
+    for char in _SPECIAL_CHARACTERS:
+        table[ord(char)] = _SPECIAL
+    return bytes(table)
+
+
+# Category bit for every ASCII character (0 for those that don't count)
+_CHAR_CATEGORY = _build_category_table()
+
+# Error messages returned for each missing category
+_ERR_UPPER = "Password must contain at least one uppercase letter"
+_ERR_LOWER = "Password must contain at least one lowercase letter"
+_ERR_DIGIT = "Password must contain at least one digit"
+_ERR_SPECIAL = 'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)'
+
+# Error for each missing category, checked in this order
+_MISSING_CATEGORY_ERRORS = (
+    (_UPPER, _ERR_UPPER),
+    (_LOWER, _ERR_LOWER),
+    (_DIGIT, _ERR_DIGIT),
+    (_SPECIAL, _ERR_SPECIAL),
+)
+
 
 def validate_password_strength(password: str) -> Optional[str]:
     """
@@ -27,19 +72,20 @@ def validate_password_strength(password: str) -> Optional[str]:
         >>> validate_password_strength("Admin123!@#")
         None
     """
-    if len(password) < 8:
-        return "Password must be at least 8 characters"
-
-    if not re.search(r'[A-Z]', password):
-        return "Password must contain at least one uppercase letter"
-
-    if not re.search(r'[a-z]', password):
-        return "Password must contain at least one lowercase letter"
+    if len(password) < _MIN_LEN:
+        return _ERR_LEN
 
-    if not re.search(r'\d', password):
-        return "Password must contain at least one digit"
+    # Single pass over the password's ASCII bytes, OR-ing together the category
+    # bits they carry. Non-ASCII characters never count toward the policy, so
+    # dropping them while encoding does not change the result.
+    seen = 0
+    for code in password.encode("ascii", "ignore"):
+        seen |= _CHAR_CATEGORY[code]
+        if seen == _ALL_CATEGORIES:
+            return None
 
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-        return "Password must contain at least one special character (!@#$%^&*(),.?\":{}|<>)"
+    for category, error in _MISSING_CATEGORY_ERRORS:
+        if not seen & category:
+            return error
 
     return None
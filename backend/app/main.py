@@ -11,6 +11,7 @@ from app.api import assignments, audit, auth, loads, ramps, statuses, users, web
 from app.core.config import get_settings
 from app.core.limiter import limiter
 from app.core.logging import get_logger, setup_logging
+from app.core.security import prepare_dummy_password_hash
 from app.db.migrations import run_migrations
 from app.db.session import AsyncSessionLocal, init_db
 
@@ -35,6 +36,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await run_migrations(session)
         logger.info("Database migrations completed")
 
+    # Hash the dummy password now; the first unknown-email login must not be slower
+    prepare_dummy_password_hash()
+
     logger.info("Application startup complete")
 
     yield
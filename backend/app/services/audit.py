@@ -1,8 +1,8 @@
 """Audit logging service."""
-import json
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import AuditLog
@@ -29,6 +29,21 @@ def json_serial(obj: Any) -> Any:
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+def serialize_snapshot(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Serialize an entity snapshot to compact JSON text for the audit log.
+
+    Args:
+        data: Entity snapshot (empty or None snapshots are not stored)
+
+    Returns:
+        JSON string, or None if there is nothing to store
+    """
+    if not data:
+        return None
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class AuditService:
     """
     Service for audit logging.
@@ -52,8 +67,8 @@ class AuditService:
         Create an audit log entry.
 
         Records an action performed on an entity with optional before/after snapshots.
-        Before/after data is serialized to JSON with datetime handling. The log entry
-        is flushed to the database but not committed (caller must commit).
+        Before/after data is serialized to JSON (via orjson) with datetime handling.
+        The log entry is flushed to the database but not committed (caller must commit).
 
         Args:
             db: Database session
@@ -78,14 +93,59 @@ class AuditService:
             ...     after={"status_id": 2, "version": 4}
             ... )
         """
-        audit_log = AuditLog(
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action=action,
-            before_json=json.dumps(before, default=json_serial) if before else None,
-            after_json=json.dumps(after, default=json_serial) if after else None,
+        audit_logs = await AuditService.log_actions(
+            db,
+            [
+                {
+                    "user_id": user_id,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "action": action,
+                    "before": before,
+                    "after": after,
+                }
+            ],
         )
-        db.add(audit_log)
+        return audit_logs[0]
+
+    @staticmethod
+    async def log_actions(db: AsyncSession, entries: Sequence[Dict[str, Any]]) -> List[AuditLog]:
+        """
+        Create several audit log entries with a single flush.
+
+        Each entry takes the same keys as the keyword arguments of log_action
+        (user_id, entity_type, entity_id, action and optional before/after).
+        All entries are added to the session together and flushed once, so bulk
+        operations cost one round-trip instead of one per entry. Nothing is
+        committed (caller must commit).
+
+        Args:
+            db: Database session
+            entries: Audit entries to record
+
+        Returns:
+            List[AuditLog]: Created audit log entries, in the order given
+
+        Example:
+            >>> await AuditService.log_actions(db, [
+            ...     {"user_id": 1, "entity_type": "ramp", "entity_id": 1, "action": "DELETE"},
+            ...     {"user_id": 1, "entity_type": "ramp", "entity_id": 2, "action": "DELETE"},
+            ... ])
+        """
+        audit_logs = [
+            AuditLog(
+                user_id=entry["user_id"],
+                entity_type=entry["entity_type"],
+                entity_id=entry["entity_id"],
+                action=entry["action"],
+                before_json=serialize_snapshot(entry.get("before")),
+                after_json=serialize_snapshot(entry.get("after")),
+            )
+            for entry in entries
+        ]
+        if not audit_logs:
+            return audit_logs
+
+        db.add_all(audit_logs)
         await db.flush()
-        return audit_log
+        return audit_logs
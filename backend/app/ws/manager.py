@@ -5,6 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
 
@@ -215,6 +216,9 @@ class ConnectionManager:
 
         disconnected_clients: Set[str] = set()
 
+        # Serialize once, not once per recipient
+        payload = orjson.dumps(message).decode()
+
         async with self._lock:
             for client_id, websocket in self.active_connections.items():
                 # Check if client's filters match
@@ -226,7 +230,7 @@ class ConnectionManager:
                         continue  # Skip this client
 
                 try:
-                    await websocket.send_json(message)
+                    await websocket.send_text(payload)
                 except WebSocketDisconnect:
                     logger.debug(f"Client {client_id} disconnected during broadcast")
                     disconnected_clients.add(client_id)
@@ -260,7 +264,7 @@ class ConnectionManager:
         websocket = self.active_connections.get(client_id)
         if websocket:
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(orjson.dumps(message).decode())
             except WebSocketDisconnect:
                 logger.debug(f"Client {client_id} disconnected while sending message")
                 await self.disconnect(client_id)
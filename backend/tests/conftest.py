@@ -1,13 +1,12 @@
 """Pytest configuration and shared fixtures."""
-import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.security import get_password_hash
 from app.db.base import Base
@@ -15,19 +14,7 @@ from app.db.models import Assignment, Load, LoadDirection, Ramp, RampType, Statu
 from app.db.session import get_db
 from app.main import app
 
-
-# ============================================================
-# Event Loop Configuration
-# ============================================================
-
-
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:ramp_tests?mode=memory&cache=shared&uri=true"
 
 
 # ============================================================
@@ -35,41 +22,107 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 # ============================================================
 
 
-@pytest.fixture(scope="function")
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
     """
-    Create test database with all tables.
+    Create the in-memory test database once per test session.
 
-    Uses in-memory SQLite database that is created and destroyed for each test.
-    This ensures test isolation and prevents test pollution.
+    The schema is built a single time; ``test_db`` isolates each test in a
+    transaction that is rolled back afterwards.
     """
-    # Create in-memory SQLite database with StaticPool to ensure same connection
+    # Create a named, shared-cache in-memory SQLite database behind an
+    # asyncio-aware connection pool, so every pooled connection sees the same
+    # schema instead of opening an empty private database
     engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
+        TEST_DATABASE_URL,
         echo=False,
-        poolclass=StaticPool,  # Use StaticPool to ensure same connection
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=4,
+        max_overflow=0,
+        pool_pre_ping=False,
         connect_args={"check_same_thread": False},
     )
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        # Disable foreign key constraints for easier test data creation, and
+        # take over transaction control from the driver so that SAVEPOINT and
+        # transactional DDL work (the pysqlite/aiosqlite recipe)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        cursor.close()
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn):  # type: ignore[no-untyped-def]
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            conn.exec_driver_sql("BEGIN")
+
+    @event.listens_for(engine.sync_engine.pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        # Resetting an AUTOCOMMIT connection hands transaction control back to
+        # the driver; keep it with SQLAlchemy for the next checkout
+        if dbapi_connection is not None:
+            dbapi_connection.isolation_level = None
+
     # Create all tables
     async with engine.begin() as conn:
-        # Disable foreign key constraints for easier test data creation
-        await conn.execute(text("PRAGMA foreign_keys=OFF"))
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create async session factory
-    async_session_factory = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    # Provide session
-    async with async_session_factory() as session:
-        yield session
+    yield engine
 
     # Cleanup
     await engine.dispose()
 
 
+@pytest.fixture(scope="function")
+async def test_db(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session whose changes are rolled back after each test.
+
+    The session joins an outer transaction and turns every ``commit()`` into a
+    released SAVEPOINT, so tests (and the code under test) may commit freely
+    while still leaving the shared database untouched. This ensures test
+    isolation and prevents test pollution.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+
+        # Provide session
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+async def test_db_autocommit(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session on an AUTOCOMMIT connection.
+
+    For tests that only smoke-check SQL features and need no rollback; each
+    statement is committed as it runs. Tables created through it are dropped
+    afterwards so the shared database stays clean.
+    """
+    list_tables = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    async with test_engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        tables_before = set((await conn.exec_driver_sql(list_tables)).scalars())
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+
+        try:
+            yield session
+        finally:
+            await session.close()
+            tables_after = set((await conn.exec_driver_sql(list_tables)).scalars())
+            for table in tables_after - tables_before:
+                await conn.exec_driver_sql(f'DROP TABLE "{table}"')
+
+
 @pytest.fixture
 async def db_session(test_db: AsyncSession) -> AsyncSession:
     """Alias for test_db for convenience."""
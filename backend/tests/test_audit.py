@@ -8,7 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import AuditLog, Ramp, User
-from app.services.audit import AuditService, json_serial
+from app.services.audit import AuditService, json_serial, serialize_snapshot
 
 
 # Mark all async tests with asyncio
@@ -183,6 +183,31 @@ class TestAuditService:
         assert audit_log is not None
         assert audit_log.action == "TEST"
 
+    async def test_log_actions_bulk(self, test_db: AsyncSession, test_admin_user: User):
+        """Test logging several actions with a single call."""
+        audit_logs = await AuditService.log_actions(
+            test_db,
+            [
+                {
+                    "user_id": test_admin_user.id,
+                    "entity_type": "bulk",
+                    "entity_id": i,
+                    "action": "DELETE",
+                    "before": {"code": f"R{i}"},
+                }
+                for i in range(3)
+            ],
+        )
+
+        assert [log.entity_id for log in audit_logs] == [0, 1, 2]
+        assert all(log.id is not None for log in audit_logs)
+        assert json.loads(audit_logs[2].before_json) == {"code": "R2"}
+        assert audit_logs[0].after_json is None
+
+    async def test_log_actions_empty(self, test_db: AsyncSession):
+        """Test that logging no actions is a no-op."""
+        assert await AuditService.log_actions(test_db, []) == []
+
 
 class TestJsonSerial:
     """Test json_serial helper function."""
@@ -215,6 +240,23 @@ class TestJsonSerial:
         assert parsed["timestamp"] == "2024-01-01T12:00:00"
 
 
+class TestSerializeSnapshot:
+    """Test serialize_snapshot helper function."""
+
+    def test_serialize_snapshot_empty(self):
+        """Test that missing or empty snapshots are not stored."""
+        assert serialize_snapshot(None) is None
+        assert serialize_snapshot({}) is None
+
+    def test_serialize_snapshot_datetime(self):
+        """Test that datetimes are serialized to ISO format."""
+        data = {"name": "Test", "timestamp": datetime(2024, 1, 1, 12, 0, 0)}
+
+        parsed = json.loads(serialize_snapshot(data))
+
+        assert parsed == {"name": "Test", "timestamp": "2024-01-01T12:00:00"}
+
+
 class TestAuditAPI:
     """Test audit API endpoints."""
 
@@ -449,14 +491,13 @@ class TestAuditAPI:
     ):
         """Test pagination on audit logs."""
         # Create multiple audit logs
-        for i in range(10):
-            await AuditService.log_action(
-                db=test_db,
-                user_id=1,
-                entity_type="test",
-                entity_id=i,
-                action="CREATE",
-            )
+        await AuditService.log_actions(
+            test_db,
+            [
+                {"user_id": 1, "entity_type": "test", "entity_id": i, "action": "CREATE"}
+                for i in range(10)
+            ],
+        )
         await test_db.commit()
 
         # Get first 5
@@ -485,14 +526,13 @@ class TestAuditAPI:
     ):
         """Test that audit logs are ordered by created_at descending (newest first)."""
         # Create multiple audit logs
-        for i in range(5):
-            await AuditService.log_action(
-                db=test_db,
-                user_id=1,
-                entity_type="order_test",
-                entity_id=i,
-                action="CREATE",
-            )
+        await AuditService.log_actions(
+            test_db,
+            [
+                {"user_id": 1, "entity_type": "order_test", "entity_id": i, "action": "CREATE"}
+                for i in range(5)
+            ],
+        )
         await test_db.commit()
 
         # Get logs
@@ -549,4 +589,4 @@ class TestAuditAPI:
         assert "before_json" in log
         assert "after_json" in log
         # Verify the after_json contains our data
-        assert log["after_json"] == '{"key": "value"}'
+        assert log["after_json"] == '{"key":"value"}'
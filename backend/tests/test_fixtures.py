@@ -0,0 +1,20 @@
+"""Tests for shared test database fixtures."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.migrations import check_column_exists
+
+
+class TestDatabaseFixtures:
+    """Test isolation guarantees of the test database fixtures."""
+
+    async def test_ddl_rolled_back_with_savepoint(self, test_db: AsyncSession):
+        """Test that DDL is transactional, so scratch tables never outlive a test."""
+        savepoint = await test_db.begin_nested()
+        await test_db.execute(text("CREATE TABLE ddl_test (id INTEGER)"))
+        assert await check_column_exists(test_db, "ddl_test", "id") is True
+
+        await savepoint.rollback()
+
+        assert await check_column_exists(test_db, "ddl_test", "id") is False
@@ -0,0 +1,272 @@
+"""Tests for security utilities."""
+
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core import security
+from app.core.security import (
+    clear_token_cache,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    get_password_hash_async,
+    prepare_dummy_password_hash,
+    verify_password_or_dummy,
+    verify_password_or_dummy_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    """Start and finish every test with an empty token cache."""
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+class TestVerifyPasswordOrDummy:
+    """Test password verification with a dummy hash fallback."""
+
+    def test_matching_password(self):
+        """Test that a matching password verifies."""
+        assert verify_password_or_dummy("admin123", get_password_hash("admin123")) is True
+
+    def test_wrong_password(self):
+        """Test that a wrong password is rejected."""
+        assert verify_password_or_dummy("wrong", get_password_hash("admin123")) is False
+
+    def test_missing_hash_runs_dummy_check(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a missing hash still verifies against the dummy hash."""
+        verified = []
+        real_verify = security.pwd_context.verify
+
+        def recording_verify(secret, hashed):
+            verified.append(hashed)
+            return real_verify(secret, hashed)
+
+        monkeypatch.setattr(security.pwd_context, "verify", recording_verify)
+
+        assert verify_password_or_dummy("admin123", None) is False
+        assert verified == [security._dummy_password_hash()]
+
+    def test_prepare_dummy_password_hash(self):
+        """Test that the dummy hash can be computed ahead of the first login."""
+        security._dummy_password_hash.cache_clear()
+
+        prepare_dummy_password_hash()
+
+        assert security._dummy_password_hash.cache_info().currsize == 1
+
+
+class TestPasswordThreadPool:
+    """Test password hashing off the event loop."""
+
+    async def test_verify_runs_on_password_pool(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that async verification runs in a password pool thread."""
+        threads = []
+        real_verify = security.verify_password_or_dummy
+
+        def recording_verify(plain, hashed):
+            threads.append(threading.current_thread().name)
+            return real_verify(plain, hashed)
+
+        monkeypatch.setattr(security, "verify_password_or_dummy", recording_verify)
+
+        hashed = get_password_hash("admin123")
+        assert await verify_password_or_dummy_async("admin123", hashed) is True
+        assert await verify_password_or_dummy_async("wrong", None) is False
+        assert all(name.startswith("pwd") for name in threads)
+        assert len(threads) == 2
+
+    async def test_hash_async_verifies(self):
+        """Test that a hash created on the pool verifies synchronously."""
+        hashed = await get_password_hash_async("admin123")
+
+        assert verify_password_or_dummy("admin123", hashed) is True
+
+
+class TestCreateAccessToken:
+    """Test JWT creation."""
+
+    def test_token_verifies_with_jose(self):
+        """Test that a directly signed HS256 token is a standard JWT."""
+        token = create_access_token({"user_id": 1, "email": "admin@test.com"})
+
+        assert security.jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+        payload = security.jwt.decode(token, security.settings.secret_key, algorithms=["HS256"])
+        assert payload["user_id"] == 1
+        assert payload["email"] == "admin@test.com"
+
+    def test_expiry_is_integer_timestamp(self):
+        """Test that ``exp`` is encoded as an integer UNIX timestamp."""
+        before = int(time.time())
+        token = create_access_token({"user_id": 1}, expires_delta=timedelta(minutes=5))
+
+        payload = security.jwt.get_unverified_claims(token)
+        assert isinstance(payload["exp"], int)
+        assert before + 299 <= payload["exp"] <= int(time.time()) + 300
+
+
+class TestDecodeAccessToken:
+    """Test JWT verification."""
+
+    def test_decodes_jose_token(self):
+        """Test that tokens signed by jose are accepted."""
+        token = security.jwt.encode(
+            {"user_id": 1, "exp": int(time.time()) + 60},
+            security.settings.secret_key,
+            algorithm="HS256",
+        )
+
+        payload = decode_access_token(token)
+        assert payload is not None
+        assert payload["user_id"] == 1
+
+    def test_rejects_tampered_payload(self):
+        """Test that changing the claims invalidates the signature."""
+        header, _, signature = create_access_token({"user_id": 1}).split(".")
+        forged = security._b64url(b'{"user_id":2,"exp":9999999999}').decode()
+
+        assert decode_access_token(f"{header}.{forged}.{signature}") is None
+
+    def test_rejects_wrong_key(self):
+        """Test that tokens signed with another key are rejected."""
+        token = security.jwt.encode(
+            {"user_id": 1, "exp": int(time.time()) + 60}, "other-secret", algorithm="HS256"
+        )
+
+        assert decode_access_token(token) is None
+
+    def test_rejects_other_algorithm(self):
+        """Test that the header's alg must be HS256."""
+        token = security.jwt.encode(
+            {"user_id": 1, "exp": int(time.time()) + 60},
+            security.settings.secret_key,
+            algorithm="HS512",
+        )
+
+        assert decode_access_token(token) is None
+
+    def test_rejects_expired_token(self):
+        """Test that expired tokens are rejected."""
+        token = create_access_token({"user_id": 1}, expires_delta=timedelta(seconds=-1))
+
+        assert decode_access_token(token) is None
+
+    def test_registered_claims_checked_like_jose(self):
+        """Test that registered claims are accepted and rejected as jose does."""
+        now = int(time.time())
+        accepted = [{"nbf": now - 60, "iat": now, "sub": "1", "jti": "abc"}, {"iat": "1"}]
+        rejected = [
+            {"nbf": now + 60},
+            {"nbf": "soon"},
+            {"iat": "yesterday"},
+            {"exp": "later"},
+            {"aud": "other-service"},
+            {"sub": 1},
+            {"jti": 1},
+            {"at_hash": "abc"},
+        ]
+        for claims, valid in [(c, True) for c in accepted] + [(c, False) for c in rejected]:
+            token = security.jwt.encode(
+                {"user_id": 1, "exp": now + 60, **claims},
+                security.settings.secret_key,
+                algorithm="HS256",
+            )
+            try:
+                security.jwt.decode(token, security.settings.secret_key, algorithms=["HS256"])
+                jose_valid = True
+            except security.JWTError:
+                jose_valid = False
+
+            assert jose_valid is valid, claims
+            assert (decode_access_token(token) is not None) is valid, claims
+
+    def test_rotated_secret_key_applies_after_cache_clear(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that tokens signed with a replaced key stop verifying."""
+        token = create_access_token({"user_id": 1})
+        assert decode_access_token(token) is not None
+
+        monkeypatch.setattr(security.settings, "secret_key", "rotated-secret")
+        clear_token_cache()
+
+        assert decode_access_token(token) is None
+        assert decode_access_token(create_access_token({"user_id": 1})) is not None
+
+    def test_rejects_malformed_token(self):
+        """Test that malformed tokens are rejected without raising."""
+        for token in ["", "abc", "a.b", "a.b.c.d", "é.é.é", "eyJ.eyJ.!!"]:
+            assert decode_access_token(token) is None
+
+
+class TestDecodeAccessTokenCache:
+    """Test caching of decoded JWT claims."""
+
+    def test_repeated_decode_returns_same_claims(self):
+        """Test that a cached decode returns the same claims as the first decode."""
+        token = create_access_token({"user_id": 1, "email": "admin@test.com"})
+
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+        assert first is not None
+        assert first == second
+        assert first["user_id"] == 1
+
+    def test_cached_claims_are_copies(self):
+        """Test that mutating returned claims does not corrupt the cache."""
+        token = create_access_token({"user_id": 1})
+
+        payload = decode_access_token(token)
+        assert payload is not None
+        payload["user_id"] = 999
+
+        assert decode_access_token(token)["user_id"] == 1
+
+    def test_cache_does_not_store_raw_token(self):
+        """Test that cache keys are digests rather than raw tokens."""
+        token = create_access_token({"user_id": 1})
+        decode_access_token(token)
+
+        assert token not in security._token_cache
+        assert all(isinstance(key, bytes) for key in security._token_cache)
+
+    def test_invalid_token_is_not_cached(self):
+        """Test that decode failures are never cached."""
+        assert decode_access_token("invalid.token.value") is None
+        assert len(security._token_cache) == 0
+
+    def test_cache_hit_skips_signature_verification(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a cached token is not decoded again."""
+        token = create_access_token({"user_id": 1})
+        calls = []
+        real_decode = security._decode_hs256
+
+        def counting_decode(*args, **kwargs):
+            calls.append(1)
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(security, "_decode_hs256", counting_decode)
+
+        decode_access_token(token)
+        decode_access_token(token)
+
+        assert len(calls) == 1
+
+    def test_cache_entry_never_outlives_token(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that cached claims are dropped once the token expires."""
+        token = create_access_token({"user_id": 1}, expires_delta=timedelta(seconds=5))
+        payload = decode_access_token(token)
+        assert payload is not None
+
+        ((expires_at, _),) = security._token_cache.values()
+        assert expires_at <= payload["exp"]
+
+        real_time = time.time
+        monkeypatch.setattr(security.time, "time", lambda: real_time() + 3600)
+
+        assert decode_access_token(token) is None
+        assert len(security._token_cache) == 0
@@ -3,108 +3,83 @@ import pytest
 
 from app.core.validators import validate_password_strength
 
+VALID_PASSWORDS = (
+    "Admin123!@#",
+    "Operator123!@#",
+    "MyP@ssw0rd",
+    "Complex1!Pass",
+    "Str0ng!Password",
+    "Test1234!@#$",
+)
+SHORT_PASSWORDS = ("Ab1!", "Test1!", "Abc123!")
+NO_UPPERCASE_PASSWORDS = ("password123!", "test1234!@#", "myp@ssw0rd")
+NO_LOWERCASE_PASSWORDS = ("PASSWORD123!", "TEST1234!@#", "MYP@SSW0RD")
+NO_DIGIT_PASSWORDS = ("Password!@#", "TestPass!@#", "MyP@ssword")
+NO_SPECIAL_PASSWORDS = ("Password123", "TestPass1234", "MyPassword1")
+WHITESPACE_PASSWORDS = ("Password 123", "Test Pass123", "MyPass word1")
+NON_ASCII_PASSWORDS = ("ÄBCDEFG1!", "pässwörd1!", "Password١!")
+SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+
 
 class TestPasswordValidation:
     """Test password strength validation."""
 
-    def test_valid_password(self):
+    @pytest.mark.parametrize("password", VALID_PASSWORDS)
+    def test_valid_password(self, password: str):
         """Test that valid passwords pass validation."""
-        valid_passwords = [
-            "Admin123!@#",
-            "Operator123!@#",
-            "MyP@ssw0rd",
-            "Complex1!Pass",
-            "Str0ng!Password",
-            "Test1234!@#$",
-        ]
-
-        for password in valid_passwords:
-            result = validate_password_strength(password)
-            assert result is None, f"Password '{password}' should be valid but got error: {result}"
+        result = validate_password_strength(password)
+        assert result is None, f"Password '{password}' should be valid but got error: {result}"
 
-    def test_password_too_short(self):
+    @pytest.mark.parametrize("password", SHORT_PASSWORDS)
+    def test_password_too_short(self, password: str):
         """Test that passwords shorter than 8 characters are rejected."""
-        short_passwords = [
-            "Ab1!",
-            "Test1!",
-            "Abc123!",
-        ]
-
-        for password in short_passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "8 characters" in result
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "8 characters" in result
 
-    def test_password_missing_uppercase(self):
+    @pytest.mark.parametrize("password", NO_UPPERCASE_PASSWORDS)
+    def test_password_missing_uppercase(self, password: str):
         """Test that passwords without uppercase letters are rejected."""
-        passwords = [
-            "password123!",
-            "test1234!@#",
-            "myp@ssw0rd",
-        ]
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "uppercase" in result
 
-        for password in passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "uppercase" in result.lower()
-
-    def test_password_missing_lowercase(self):
+    @pytest.mark.parametrize("password", NO_LOWERCASE_PASSWORDS)
+    def test_password_missing_lowercase(self, password: str):
         """Test that passwords without lowercase letters are rejected."""
-        passwords = [
-            "PASSWORD123!",
-            "TEST1234!@#",
-            "MYP@SSW0RD",
-        ]
-
-        for password in passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "lowercase" in result.lower()
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "lowercase" in result
 
-    def test_password_missing_digit(self):
+    @pytest.mark.parametrize("password", NO_DIGIT_PASSWORDS)
+    def test_password_missing_digit(self, password: str):
         """Test that passwords without digits are rejected."""
-        passwords = [
-            "Password!@#",
-            "TestPass!@#",
-            "MyP@ssword",
-        ]
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "digit" in result
 
-        for password in passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "digit" in result.lower()
-
-    def test_password_missing_special_char(self):
+    @pytest.mark.parametrize("password", NO_SPECIAL_PASSWORDS)
+    def test_password_missing_special_char(self, password: str):
         """Test that passwords without special characters are rejected."""
-        passwords = [
-            "Password123",
-            "TestPass1234",
-            "MyPassword1",
-        ]
-
-        for password in passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "special character" in result.lower()
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "special character" in result
 
-    def test_password_all_special_chars_accepted(self):
+    @pytest.mark.parametrize("char", SPECIAL_CHARS)
+    def test_password_all_special_chars_accepted(self, char: str):
         """Test that all documented special characters are accepted."""
-        special_chars = "!@#$%^&*(),.?\":{}|<>"
+        password = f"Test123{char}"
+        result = validate_password_strength(password)
+        assert result is None, f"Special char '{char}' should be accepted but got: {result}"
 
-        for char in special_chars:
-            password = f"Test123{char}"
-            result = validate_password_strength(password)
-            assert result is None, f"Password with special char '{char}' should be valid but got: {result}"
-
-    def test_password_whitespace_not_special_char(self):
+    @pytest.mark.parametrize("password", WHITESPACE_PASSWORDS)
+    def test_password_whitespace_not_special_char(self, password: str):
         """Test that whitespace is not considered a special character."""
-        passwords = [
-            "Password 123",
-            "Test Pass123",
-            "MyPass word1",
-        ]
-
-        for password in passwords:
-            result = validate_password_strength(password)
-            assert result is not None
-            assert "special character" in result.lower()
+        result = validate_password_strength(password)
+        assert result is not None
+        assert "special character" in result
+
+    @pytest.mark.parametrize("password", NON_ASCII_PASSWORDS)
+    def test_non_ascii_characters_not_counted(self, password: str):
+        """Test that non-ASCII letters and digits do not satisfy the policy."""
+        assert validate_password_strength(password) is not None
@@ -7,6 +7,7 @@ import pytest
 from httpx import AsyncClient
 from starlette.testclient import TestClient
 
+from app.api.websocket import _looks_like_jwt, _token_from_subprotocols
 from app.db.models import Assignment, Load, Ramp, Status, User
 from app.main import app
 from app.ws.manager import manager
@@ -32,6 +33,18 @@ class TestWebSocketConnection:
             assert "client_id" in data
             assert "timestamp" in data
 
+    def test_websocket_client_ids_are_unique(self, client: AsyncClient, admin_token: str):
+        """Test that each connection gets its own client ID."""
+        sync_client = TestClient(app)
+
+        client_ids = []
+        for _ in range(2):
+            with sync_client.websocket_connect(f"/api/ws?token={admin_token}") as websocket:
+                client_ids.append(websocket.receive_json()["client_id"])
+
+        assert client_ids[0] != client_ids[1]
+        assert all(client_id.startswith("user_1_") for client_id in client_ids)
+
     def test_websocket_connect_without_token(self):
         """Test WebSocket connection fails without token."""
         sync_client = TestClient(app)
@@ -49,6 +62,46 @@ class TestWebSocketConnection:
                 pass
 
 
+class TestWebSocketProtocolToken:
+    """Test token extraction from the Sec-WebSocket-Protocol header."""
+
+    def test_bearer_prefix(self):
+        """Test that a single Bearer entry yields its token."""
+        assert _token_from_subprotocols("Bearer.abc.def.ghi") == "abc.def.ghi"
+
+    def test_bearer_prefix_case_insensitive(self):
+        """Test that the Bearer prefix is matched case-insensitively."""
+        assert _token_from_subprotocols("bearer.abc.def.ghi") == "abc.def.ghi"
+
+    def test_bearer_among_other_protocols(self):
+        """Test that the Bearer entry is found among other subprotocols."""
+        header = "graphql-ws,  Bearer.abc.def.ghi , json"
+        assert _token_from_subprotocols(header) == "abc.def.ghi"
+
+    def test_no_bearer_entry(self):
+        """Test that headers without a Bearer entry yield no token."""
+        assert _token_from_subprotocols("graphql-ws, json") is None
+        assert _token_from_subprotocols("Bearer.") is None
+        assert _token_from_subprotocols("") is None
+
+
+class TestWebSocketTokenPrefilter:
+    """Test the JWT shape check run before token decoding."""
+
+    def test_real_token_passes(self, admin_token: str):
+        """Test that issued tokens pass the prefilter."""
+        assert _looks_like_jwt(admin_token) is True
+
+    def test_malformed_tokens_rejected(self):
+        """Test that obviously malformed tokens are rejected."""
+        assert _looks_like_jwt("invalid_token") is False
+        assert _looks_like_jwt("eyJhbGciOiJIUzI1NiJ9.payload") is False
+        assert _looks_like_jwt("abc.def.ghi") is False
+        assert _looks_like_jwt("eyJhbGci.pay load.sig") is False
+        assert _looks_like_jwt("eyJhbGci.pay+load/.sig") is False
+        assert _looks_like_jwt("eyJ" + "a" * 9000 + ".b.c") is False
+
+
 class TestWebSocketSubscription:
     """Test WebSocket subscription and filtering."""
 
@@ -435,10 +488,15 @@ class TestWebSocketConnectionManager:
         )
 
         # Verify IB client received message
-        assert mock_ws_ib.send_json.called
+        assert mock_ws_ib.send_text.called
 
         # Verify ALL client received message (no filter)
-        assert mock_ws_all.send_json.called
+        assert mock_ws_all.send_text.called
+
+        # Both clients received the same pre-serialized payload
+        payload = mock_ws_ib.send_text.call_args.args[0]
+        assert payload == mock_ws_all.send_text.call_args.args[0]
+        assert json.loads(payload)["type"] == "assignment_created"
 
         # Cleanup
         await manager.disconnect(client_ib)